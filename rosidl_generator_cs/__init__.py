@@ -12,7 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
+import json
+import os
+import sys
+import tarfile
+import tempfile
+
+from concurrent.futures import ProcessPoolExecutor
+
 from ast import literal_eval
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 from rosidl_cmake import generate_files
 from rosidl_parser.definition import AbstractGenericString
@@ -31,25 +46,130 @@ from rosidl_parser.definition import UnboundedSequence
 # be replaced with Unity types (e.g. UnityEngine.Vector3)
 USE_UNITY_TYPES = True
 
-def generate_cs(generator_arguments_file):
-    mapping = {
-        'msg.cs.em': '%s.cs'
-    }
+_MAPPING = {
+    'msg.cs.em': '%s.cs'
+}
+
+# Only shard the IDL list across worker processes when there is enough work
+# per worker to amortize the process startup cost.
+_MIN_IDLS_PER_JOB = 8
+
 
+def generate_cs(generator_arguments_file):
+    # Opt-in generation cache: when ROSIDL_CACHE_DIR is set, packages whose
+    # IDL files and templates are unchanged skip the template render entirely
+    # and are restored from a tar of the previous run's output.
+    cache_dir = os.environ.get('ROSIDL_CACHE_DIR')
+    if not cache_dir:
+        return _render(generator_arguments_file)
+
+    with open(generator_arguments_file, 'r') as f:
+        args = json.load(f)
+    output_dir = args['output_dir']
+    cache_path = os.path.join(
+        cache_dir,
+        '%s-%s.tar' % (args['package_name'],
+                       _generation_cache_key(args, _MAPPING)))
+
+    if os.path.exists(cache_path):
+        with tarfile.open(cache_path) as tar:
+            members = tar.getmembers()
+            tar.extractall(output_dir)
+        return [
+            os.path.join(output_dir, member.name)
+            for member in members if member.isfile()]
+
+    generated_files = _render(generator_arguments_file)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    # Write to a per-process temporary file first so concurrent builds never
+    # observe a partially written cache entry.
+    tmp_path = '%s.%d.tmp' % (cache_path, os.getpid())
+    with tarfile.open(tmp_path, 'w') as tar:
+        for path in generated_files or []:
+            tar.add(path, arcname=os.path.relpath(path, output_dir))
+    os.replace(tmp_path, cache_path)
+    return generated_files
+
+
+def _render(generator_arguments_file):
+    with open(generator_arguments_file, 'r') as f:
+        args = json.load(f)
+    idl_tuples = args.get('idl_tuples', [])
+    jobs = _job_count(len(idl_tuples))
+    if jobs <= 1:
+        return generate_files(
+            generator_arguments_file, _MAPPING,
+            post_process_callback=prefix_with_bom_if_necessary)
+
+    # Per-message generation is independent, so write one arguments file per
+    # shard, render the shards in parallel and concatenate the results.
+    generated_files = []
+    with tempfile.TemporaryDirectory(
+            prefix='rosidl_generator_cs_') as shard_dir:
+        shard_files = []
+        for index in range(jobs):
+            shard_args = dict(args)
+            shard_args['idl_tuples'] = idl_tuples[index::jobs]
+            shard_path = os.path.join(shard_dir, 'args_%d.json' % index)
+            with open(shard_path, 'w') as f:
+                json.dump(shard_args, f)
+            shard_files.append(shard_path)
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for shard_result in executor.map(_render_shard, shard_files):
+                generated_files.extend(shard_result or [])
+    return generated_files
+
+
+def _render_shard(shard_arguments_file):
     return generate_files(
-        generator_arguments_file, mapping,
+        shard_arguments_file, _MAPPING,
         post_process_callback=prefix_with_bom_if_necessary)
 
 
+def _job_count(idl_count):
+    jobs = os.environ.get('ROSIDL_GENERATOR_CS_JOBS')
+    if jobs is not None:
+        jobs = int(jobs)
+    else:
+        jobs = os.cpu_count() or 1
+    return max(1, min(jobs, idl_count // _MIN_IDLS_PER_JOB))
+
+
+def _generation_cache_key(args, mapping):
+    """
+    Compute a digest of everything the generated code depends on.
+
+    The key covers the package name, the templates used for generation and
+    the content of every IDL file, so any change to the inputs produces a
+    different cache entry.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(args['package_name'].encode())
+    for template in sorted(mapping):
+        with open(os.path.join(args['template_dir'], template), 'rb') as f:
+            hasher.update(f.read())
+    for idl_tuple in args.get('idl_tuples', []):
+        base_path, _, relative_path = idl_tuple.rpartition(':')
+        hasher.update(relative_path.encode())
+        with open(os.path.join(base_path, relative_path), 'rb') as f:
+            hasher.update(f.read())
+    return hasher.hexdigest()
+
+
+_BOM_PREFIX = '\ufeff' + \
+    '// NOLINT: This file starts with a BOM ' + \
+    'since it contain non-ASCII characters\n'
+
+
+# Trivial message types expand to identical file bodies, so memoizing on the
+# content turns the repeat ASCII scans into hash lookups. The cache is
+# bounded to avoid holding every generated file in memory.
+@lru_cache(maxsize=4096)
 def prefix_with_bom_if_necessary(content):
-    try:
-        content.encode('ASCII')
-    except UnicodeError:
-        prefix = '\ufeff' + \
-            '// NOLINT: This file starts with a BOM ' + \
-            'since it contain non-ASCII characters\n'
-        content = prefix + content
-    return content
+    if content.isascii():
+        return content
+    return _BOM_PREFIX + content
 
 
 MSG_TYPE_TO_CS = {    'byte' : 'sbyte',
@@ -70,6 +190,7 @@ MSG_TYPE_TO_CS = {    'byte' : 'sbyte',
                    'float64' : 'double',
                     'double' : 'double',
                     'string' : 'string',
+                   'wstring' : 'string',
                       'time' : 'ROSBridgeLib.msg_helpers.Time',
                   'duration' : 'ROSBridgeLib.msg_helpers.Duration'}
 
@@ -81,33 +202,152 @@ MSG_TO_UNITY = {      'geometry_msgs.msg.Point' : 'UnityEngine.Vector3',
                     'geometry_msgs.msg.Vector3' : 'UnityEngine.Vector3',
                  'geometry_msgs.msg.Quaternion' : 'UnityEngine.Quaternion'}
 
-def msg_type_only_to_cs(type_):
-    """
-    Convert a message type into the C# definition, ignoring array types.
+# Intern the table keys and values: typenames coming out of rosidl_parser are
+# mostly interned already, so lookups take CPython's pointer-equality fast
+# path instead of comparing characters.
+MSG_TYPE_TO_CS = {
+    sys.intern(key): sys.intern(value)
+    for key, value in MSG_TYPE_TO_CS.items()}
+MSG_TO_UNITY = {
+    sys.intern(key): sys.intern(value)
+    for key, value in MSG_TO_UNITY.items()}
+
+# Fold the Unity substitution into the lookup tables once at import so the
+# per-call conversion code never has to test USE_UNITY_TYPES.
+if USE_UNITY_TYPES:
+    MSG_TYPE_TO_CS = {
+        key: MSG_TO_UNITY.get(value, value)
+        for key, value in MSG_TYPE_TO_CS.items()}
+    _NAMESPACED_TO_UNITY = MSG_TO_UNITY
+else:
+    _NAMESPACED_TO_UNITY = {}
+
+# Cache of fully resolved C# type strings (including the Unity substitution),
+# keyed by a cheap hashable summary of the rosidl type. The conversion below
+# is called once per field of every message, so repeated types become a single
+# dict lookup instead of an isinstance chain plus two table lookups.
+_CS_TYPE_CACHE = {}
+
+
+def _cs_type_cache_key(type_):
+    if isinstance(type_, BasicType):
+        return ('B', type_.typename)
+    if isinstance(type_, AbstractString):
+        return 'S'
+    if isinstance(type_, AbstractWString):
+        return 'W'
+    if isinstance(type_, NamespacedType):
+        return ('N', tuple(type_.namespaced_name()))
+    return None
 
-    @param type_: The message type
-    @type type_: rosidl_parser.Type
-    """
-    if isinstance(type_, AbstractNestedType):
-        type_ = type_.value_type
+
+def _basic_only_to_cs(type_):
+    return MSG_TYPE_TO_CS[type_.typename]
+
+
+def _string_only_to_cs(type_):
+    return MSG_TYPE_TO_CS['string']
+
+
+def _wstring_only_to_cs(type_):
+    return MSG_TYPE_TO_CS['wstring']
+
+
+# Joined namespaced names keyed by the namespaced_name() tuple. The same few
+# referenced message types appear in many fields, so each distinct name is
+# joined (and interned, making the Unity lookup a pointer comparison) once.
+_NS_JOIN = {}
+
+
+def _namespaced_only_to_cs(type_):
+    key = tuple(type_.namespaced_name())
+    cs_type = _NS_JOIN.get(key) or _NS_JOIN.setdefault(
+        key, sys.intern('.'.join(key)))
+    return _NAMESPACED_TO_UNITY.get(cs_type, cs_type)
+
+
+# Dispatch on the concrete type class instead of walking an isinstance chain
+# on every call. Concrete subclasses (e.g. the bounded/unbounded string
+# classes) are resolved once in _only_to_cs_fallback and then inserted here so
+# subsequent calls take the dict fast path.
+_ONLY_TO_CS_DISPATCH = {
+    BasicType: _basic_only_to_cs,
+    NamespacedType: _namespaced_only_to_cs,
+}
+
+
+def _only_to_cs_fallback(type_):
     if isinstance(type_, BasicType):
-        cs_type = MSG_TYPE_TO_CS[type_.typename]
+        handler = _basic_only_to_cs
     elif isinstance(type_, AbstractString):
-        cs_type = MSG_TYPE_TO_CS['string']
+        handler = _string_only_to_cs
     elif isinstance(type_, AbstractWString):
-        cs_type = MSG_TYPE_TO_CS['wstring']
+        handler = _wstring_only_to_cs
     elif isinstance(type_, NamespacedType):
-        typename = '.'.join(type_.namespaced_name())
-        cs_type = typename
+        handler = _namespaced_only_to_cs
     else:
         assert False, type_
+    _ONLY_TO_CS_DISPATCH[type(type_)] = handler
+    return handler
+
+
+def msg_type_only_to_cs(type_):
+    """
+    Convert a message type into the C# definition, ignoring array types.
 
-    if USE_UNITY_TYPES and cs_type in MSG_TO_UNITY:
-        cs_type = MSG_TO_UNITY[cs_type]
-    
+    @param type_: The message type
+    @type type_: rosidl_parser.Type
+    """
+    # Normalize nested types to their element type with a single attribute
+    # probe; only AbstractNestedType subclasses carry a value_type.
+    type_ = getattr(type_, 'value_type', type_)
+
+    key = _cs_type_cache_key(type_)
+    cs_type = _CS_TYPE_CACHE.get(key)
+    if cs_type is not None:
+        return cs_type
+
+    handler = _ONLY_TO_CS_DISPATCH.get(type(type_))
+    if handler is None:
+        handler = _only_to_cs_fallback(type_)
+    cs_type = handler(type_)
+
+    if key is not None:
+        _CS_TYPE_CACHE[key] = cs_type
     return cs_type
 
 
+# Rendered List<...>/array type strings, keyed by the element C# type.
+# Fields of the same element type repeat across a package, so the template
+# only gets formatted once per distinct element type.
+_LIST_OF = {}
+_ARRAY_OF = {}
+
+
+def _sequence_type_to_cs(type_):
+    cs_type = msg_type_only_to_cs(type_)
+    return _LIST_OF.get(cs_type) or _LIST_OF.setdefault(
+        cs_type, f'System.Collections.Generic.List<{cs_type}> ')
+    #\
+    #    ('rosidl_runtime_cpp::BoundedVector<%s, %u, typename std::allocator_traits' +
+    #     '<ContainerAllocator>::template rebind_alloc<%s>>') % (cpp_type,
+    #                                                            type_.maximum_size,
+    #                                                            cpp_type)
+
+
+def _array_type_to_cs(type_):
+    cs_type = msg_type_only_to_cs(type_)
+    return _ARRAY_OF.get(cs_type) or _ARRAY_OF.setdefault(
+        cs_type, f'{cs_type}[] ') #, type_.size)
+
+
+_TYPE_TO_CS_DISPATCH = {
+    UnboundedSequence: _sequence_type_to_cs,
+    BoundedSequence: _sequence_type_to_cs,
+    Array: _array_type_to_cs,
+}
+
+
 def msg_type_to_cs(type_):
     """
     Convert a message type into the C# definition, along with the array type.
@@ -115,23 +355,82 @@ def msg_type_to_cs(type_):
     @param type_: The message type
     @type type_: rosidl_parser.Type
     """
-    cs_type = msg_type_only_to_cs(type_)
+    handler = _TYPE_TO_CS_DISPATCH.get(type(type_))
+    if handler is not None:
+        return handler(type_)
 
     if isinstance(type_, AbstractNestedType):
-        if isinstance(type_, UnboundedSequence):
-            return 'System.Collections.Generic.List<%s> '% (cs_type)
-        elif isinstance(type_, BoundedSequence):
-            return 'System.Collections.Generic.List<%s> '% (cs_type)
-            #\
-            #    ('rosidl_runtime_cpp::BoundedVector<%s, %u, typename std::allocator_traits' +
-            #     '<ContainerAllocator>::template rebind_alloc<%s>>') % (cpp_type,
-            #                                                            type_.maximum_size,
-            #                                                            cpp_type)
+        if isinstance(type_, AbstractSequence):
+            handler = _sequence_type_to_cs
         else:
             assert isinstance(type_, Array)
-            return '%s[] ' % cs_type #, type_.size)
-    else:
-        return cs_type
+            handler = _array_type_to_cs
+        _TYPE_TO_CS_DISPATCH[type(type_)] = handler
+        return handler(type_)
+
+    return msg_type_only_to_cs(type_)
+
+
+# Specialized per-element formatters for array defaults, keyed like
+# _CS_TYPE_CACHE. Resolving the element type once per array keeps all type
+# dispatch (and the string-array brace wrapping) out of the inner loop.
+_EMITTER_CACHE = {}
+
+
+def _make_emitter(value_type):
+    if isinstance(value_type, AbstractWString):
+        return lambda value: f'{{u"{escape_wstring(value)}"}}'
+    if isinstance(value_type, AbstractGenericString):
+        return lambda value: f'{{"{escape_string(value)}"}}'
+    formatter = _PRIM_BY_NAME.get(value_type.typename)
+    if formatter is None:
+        raise ValueError(
+            "unknown primitive type '%s'" % value_type.typename)
+    return formatter
+
+
+# The minimum 32/64 bit values have to be spelled as an expression because
+# the compiler parses the leading '-' of the plain literal as unary minus.
+_INT32_MIN = -2147483648
+_INT64_MIN = -9223372036854775808
+_INT32_MIN_STR = '(-2147483647 - 1)'
+_INT64_MIN_STR = '(-9223372036854775807L - 1)'
+
+# Integer typenames whose decimal formatting numpy reproduces exactly, mapped
+# to the C# literal suffix appended per element. Floating point types stay on
+# the scalar path because numpy's repr can differ from Python's.
+_NUMPY_INT_SUFFIX = {
+    'int8': '', 'uint8': '',
+    'int16': '', 'uint16': '',
+    'int32': '', 'uint32': '',
+    'int64': 'L', 'uint64': 'UL',
+}
+
+
+def _format_int_array(value, typename, suffix):
+    arr = np.asarray(value)
+    if arr.dtype.kind not in 'iu':
+        return None
+    # INT32_MIN / INT64_MIN need the parenthesized literal form; leave any
+    # array containing them to the scalar formatters.
+    if typename == 'int32' and arr.min() == _INT32_MIN:
+        return None
+    if typename == 'int64' and arr.min() == _INT64_MIN:
+        return None
+    parts = arr.astype(str)
+    if suffix:
+        parts = np.char.add(parts, suffix)
+    return parts.tolist()
+
+
+def _element_emitter(value_type):
+    key = _cs_type_cache_key(value_type)
+    if key is None:
+        return _make_emitter(value_type)
+    emitter = _EMITTER_CACHE.get(key)
+    if emitter is None:
+        emitter = _EMITTER_CACHE[key] = _make_emitter(value_type)
+    return emitter
 
 
 def value_to_cs(type_, value):
@@ -147,30 +446,72 @@ def value_to_cs(type_, value):
     @type value: python builtin (bool, int, float, str or list)
     @returns: a string containing the C++ representation of the value
     """
-    assert not isinstance(type_, NamespacedType), \
-        "Could not convert non-primitive type '%s' to C#" % (type_)
-    assert value is not None, "Value for type '%s' must not be None" % (type_)
+    if isinstance(type_, NamespacedType):
+        raise TypeError(
+            "Could not convert non-primitive type '%s' to C#" % (type_))
+    if value is None:
+        raise ValueError("Value for type '%s' must not be None" % (type_))
 
     if not isinstance(type_, AbstractNestedType):
         return primitive_value_to_cs(type_, value)
 
-    cs_values = []
-    is_string_array = isinstance(type_.value_type, AbstractGenericString)
-    for single_value in value:
-        cs_value = primitive_value_to_cs(type_.value_type, single_value)
-        if is_string_array:
-            tmp_cs_value = '{%s}' % cs_value
-        else:
-            tmp_cs_value = cs_value
-        cs_values.append(tmp_cs_value)
-    cs_value = '{%s}' % ', '.join(cs_values)
+    value_type = type_.value_type
+    is_string_array = isinstance(value_type, AbstractGenericString)
+    cs_values = None
+    if np is not None and len(value) > 64 and isinstance(value_type, BasicType):
+        suffix = _NUMPY_INT_SUFFIX.get(value_type.typename)
+        if suffix is not None:
+            cs_values = _format_int_array(value, value_type.typename, suffix)
+    if cs_values is None:
+        emitter = _element_emitter(value_type)
+        cs_values = [emitter(single_value) for single_value in value]
+    cs_value = f"{{{', '.join(cs_values)}}}"
     if len(cs_values) > 1 and not is_string_array:
         # Only wrap in a second set of {} if the array length is > 1.
         # This avoids "warning: braces around scalar initializer"
-        cs_value = '{%s}' % cs_value
+        cs_value = f'{{{cs_value}}}'
     return cs_value
 
 
+def _format_int32(value):
+    # Handle edge case for INT32_MIN
+    # Specifically, MSVC is not happy in this case
+    if _INT32_MIN == value:
+        return _INT32_MIN_STR
+    return f'{value}'
+
+
+def _format_int64(value):
+    # Handle edge case for INT64_MIN
+    # See https://en.cppreference.com/w/cpp/language/integer_literal
+    if _INT64_MIN == value:
+        return _INT64_MIN_STR
+    return f'{value}L'
+
+
+# Formatter per BasicType typename, replacing the linear chain of typename
+# comparisons with a single dict lookup per literal.
+_PRIM_BY_NAME = {
+    'boolean': lambda value: 'true' if value else 'false',
+    'int32': _format_int32,
+    'uint32': lambda value: f'{value}',
+    'int64': _format_int64,
+    'uint64': lambda value: f'{value}UL',
+    'float': lambda value: f'{value}f',
+    'string': lambda value: f'"{value}"',
+}
+for _typename in [
+    'short', 'unsigned short',
+    'char', 'wchar',
+    'double', 'long double',
+    'octet',
+    'int8', 'uint8',
+    'int16', 'uint16',
+]:
+    _PRIM_BY_NAME[_typename] = str
+del _typename
+
+
 def primitive_value_to_cs(type_, value):
     """
     Convert a python value into a string representing that value in C#.
@@ -183,84 +524,76 @@ def primitive_value_to_cs(type_, value):
     @type value: python builtin (bool, int, float or str)
     @returns: a string containing the C++ representation of the value
     """
-    assert isinstance(type_, (BasicType, AbstractGenericString)), \
-        "Could not convert non-primitive type '%s' to C#" % (type_)
-    assert value is not None, "Value for type '%s' must not be None" % (type_)
+    if not isinstance(type_, (BasicType, AbstractGenericString)):
+        raise TypeError(
+            "Could not convert non-primitive type '%s' to C#" % (type_))
+    if value is None:
+        raise ValueError("Value for type '%s' must not be None" % (type_))
 
     if isinstance(type_, AbstractString):
-        return '"%s"' % escape_string(value)
+        return f'"{escape_string(value)}"'
 
     if isinstance(type_, AbstractWString):
-        return 'u"%s"' % escape_wstring(value)
+        return f'u"{escape_wstring(value)}"'
 
     if isinstance(type_, AbstractGenericString):
-        return '"%s"' % escape_string(value)
-
-    if type_.typename == 'boolean':
-        return 'true' if value else 'false'
-
-    if type_.typename in [
-        'short', 'unsigned short',
-        'char', 'wchar',
-        'double', 'long double',
-        'octet',
-        'int8', 'uint8',
-        'int16', 'uint16',
-    ]:
-        return str(value)
-
-    if type_.typename == 'int32':
-        # Handle edge case for INT32_MIN
-        # Specifically, MSVC is not happy in this case
-        if -2147483648 == value:
-            return '({0} - 1)'.format(value + 1)
-        return '%s' % value
+        return f'"{escape_string(value)}"'
 
-    if type_.typename == 'uint32':
-        return '%s' % value
+    formatter = _PRIM_BY_NAME.get(type_.typename)
+    if formatter is None:
+        raise ValueError("unknown primitive type '%s'" % type_.typename)
+    return formatter(value)
 
-    if type_.typename == 'int64':
-        # Handle edge case for INT64_MIN
-        # See https://en.cppreference.com/w/cpp/language/integer_literal
-        if -9223372036854775808 == value:
-            return '(%sL - 1)' % (value + 1)
-        return '%sL' % value
 
-    if type_.typename == 'uint64':
-        return '%sUL' % value
-
-    if type_.typename == 'float':
-        return '%sf' % value
-
-    if type_.typename == 'string':
-        return '"%s"' % value
-
-    assert False, "unknown primitive type '%s'" % type_.typename
+_DEFAULT_BY_TYPENAME = {typename: '0.0f' for typename in FLOATING_POINT_TYPES}
+_DEFAULT_BY_TYPENAME['boolean'] = 'false'
 
 
 def default_value_from_type(type_):
     if isinstance(type_, AbstractGenericString):
         return '""'
-    elif isinstance(type_, BasicType) and type_.typename in FLOATING_POINT_TYPES:
-        return '0.0f'
-    elif isinstance(type_, BasicType) and type_.typename == 'boolean':
-        return 'false'
-    return 0
+    return _DEFAULT_BY_TYPENAME.get(getattr(type_, 'typename', None), 0)
+
+
+_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', '"': '\\"'})
 
 
 def escape_string(s):
-    s = s.replace('\\', '\\\\')
-    s = s.replace('"', '\\"')
-    return s
+    return s.translate(_ESCAPE_TABLE)
 
 
 def escape_wstring(s):
     return escape_string(s)
 
-def array_initializer(type_):
+_LIST_INITIALIZER_OF = {}
+_ARRAY_INITIALIZER_OF = {}
+
+
+def _sequence_initializer_to_cs(type_):
     cs_type = msg_type_only_to_cs(type_)
+    return _LIST_INITIALIZER_OF.get(cs_type) or _LIST_INITIALIZER_OF.setdefault(
+        cs_type, f"new System.Collections.Generic.List<{cs_type}>()")
+
+
+def _array_initializer_to_cs(type_):
+    key = (msg_type_only_to_cs(type_), type_.size)
+    return _ARRAY_INITIALIZER_OF.get(key) or _ARRAY_INITIALIZER_OF.setdefault(
+        key, "new %s[%s]" % key)
 
-    if isinstance(type_, UnboundedSequence) or isinstance(type_, BoundedSequence):
-        return "new System.Collections.Generic.List<%s>()"%(cs_type)
-    
-    return "new %s[%s]"%(cs_type, type_.size)
+
+_INITIALIZER_DISPATCH = {
+    UnboundedSequence: _sequence_initializer_to_cs,
+    BoundedSequence: _sequence_initializer_to_cs,
+    Array: _array_initializer_to_cs,
+}
+
+
+def array_initializer(type_):
+    handler = _INITIALIZER_DISPATCH.get(type(type_))
+    if handler is None:
+        if isinstance(type_, AbstractSequence):
+            handler = _sequence_initializer_to_cs
+        else:
+            handler = _array_initializer_to_cs
+        _INITIALIZER_DISPATCH[type(type_)] = handler
+    return handler(type_)